@@ -0,0 +1,426 @@
+"""
+Planning benchmark suite: speed and path quality of the core hot paths.
+
+Times objective, obstacle_penalty, build_spline, astar_path,
+generate_obstacles and the end-to-end lagrangian_optimizer over a grid of
+obstacle counts, canvas sizes, n_ctrl and n_samples. Every scenario is
+seeded, so two runs on the same machine plan the same paths. End-to-end
+records also carry path length, minimum clearance and fallback rate.
+
+Run from the project root:
+
+    python -m benchmarks.planning                       # quick preset
+    python -m benchmarks.planning --preset full --out bench.json
+    python -m benchmarks.planning --save-baseline benchmarks/baseline.json
+    python -m benchmarks.planning --baseline benchmarks/baseline.json
+
+Every record carries a gate time_s: the best-of-repeats time per call for
+micro-benchmarks, and for lagrangian_optimizer the sum over seeds of each
+seed's best-of-repeats run. With a baseline, every matching record gets a
+baseline_ratio (current / baseline time_s). The exit status is 1 if any
+speed or quality regression exceeds the tolerances.
+
+Timings are machine-specific: benchmarks/baseline.json holds the quick
+preset as recorded on one development machine (see its "meta" block).
+Re-record it with --save-baseline before comparing on other hardware.
+Path-quality figures are comparable anywhere.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from core.optimizer import (generate_obstacles, astar_path, build_spline,
+                            obstacle_penalty, objective, lagrangian_optimizer)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "baseline.json")
+
+# Allowed slowdown per bench (fraction) before --baseline flags it. Set
+# from the run-to-run spread of unchanged code on a shared single-core
+# VM; use --time-tol to apply a tighter bound on a quiet machine.
+TIME_TOL = {
+    "generate_obstacles": 1.0,
+    "astar_path": 1.0,
+    "build_spline": 1.0,
+    "obstacle_penalty": 1.0,
+    "objective": 1.0,
+    "lagrangian_optimizer": 0.75,
+}
+
+# Defaults of lagrangian_optimizer, shared by the micro-benchmarks
+LAM, GAMMA, CLEARANCE = 25.0, 2.5, 22.0
+
+PRESETS = {
+    "quick": {
+        "obstacles": [2, 6],
+        "canvas": [(600, 400)],
+        "n_ctrl": [8, 12],
+        "n_samples": [100, 200],
+        "seeds": [0, 1, 2],
+    },
+    "full": {
+        "obstacles": [2, 4, 8, 12],
+        "canvas": [(600, 400), (1200, 800)],
+        "n_ctrl": [6, 12, 18],
+        "n_samples": [100, 200, 400],
+        "seeds": [0, 1, 2, 3, 4],
+    },
+}
+
+
+# ---------------------------------------------------------
+# SEEDED SCENARIOS
+# ---------------------------------------------------------
+def make_scenario(seed, n_obstacles, canvas_size):
+    """ Start/end in opposite corners, obstacles from a seeded RNG. """
+    W, H = canvas_size
+    start, end = (50, 50), (W - 50, H - 50)
+
+    # generate_obstacles draws from the global NumPy RNG
+    np.random.seed(seed)
+    obstacles = generate_obstacles(n_obstacles, width=W, height=H,
+                                   start=start, end=end)
+    return {"seed": seed, "start": np.array(start, float),
+            "end": np.array(end, float), "obstacles": obstacles,
+            "canvas_size": (W, H)}
+
+
+def initial_ctrl(scn, n_ctrl):
+    """
+    Control points sampled from the A* path when one exists, so the
+    objective is timed on a (mostly) feasible path instead of the
+    straight line, which usually hits the barrier's early np.inf exit.
+    """
+    path = astar_path(scn["start"], scn["end"], scn["obstacles"],
+                      scn["canvas_size"], clearance=CLEARANCE)
+    if path is None or len(path) < n_ctrl + 2:
+        xs = np.linspace(scn["start"][0], scn["end"][0], n_ctrl+2)[1:-1]
+        ys = np.linspace(scn["start"][1], scn["end"][1], n_ctrl+2)[1:-1]
+        return np.column_stack([xs, ys])
+    idx = np.linspace(0, len(path)-1, n_ctrl+2).round().astype(int)[1:-1]
+    return path[idx].astype(float)
+
+
+# ---------------------------------------------------------
+# MEASUREMENT HELPERS
+# ---------------------------------------------------------
+def time_call(fn, repeat):
+    """
+    Median / min seconds per call over `repeat` samples of ~10 ms each.
+    The min is the gate time_s: it is the least disturbed by other load.
+    """
+    fn()    # warm-up: lazy imports and caches must not pick `number`
+    timer = timeit.Timer(fn)
+
+    # Many short samples (~10 ms each) rather than a few long ones: the
+    # min then lands in a quiet moment even on a busy machine.
+    once = timer.timeit(number=1)
+    number = max(1, int(0.01 / max(once, 1e-9)))
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"time_s": float(min(runs)), "median_s": float(np.median(runs)),
+            "min_s": float(min(runs)), "number": number}
+
+
+def path_length(samples):
+    return float(np.sum(np.linalg.norm(np.diff(samples, axis=0), axis=1)))
+
+
+def min_clearance(samples, obstacles):
+    """ Smallest distance from any path point to an obstacle's edge. """
+    if not obstacles:
+        return None
+    return float(min(np.min(np.linalg.norm(samples - c, axis=1)) - r
+                     for c, r in obstacles))
+
+
+def _canvas(canvas_size):
+    return f"{canvas_size[0]}x{canvas_size[1]}"
+
+
+def _record(bench, params, **values):
+    rec = {"bench": bench, "params": params}
+    rec.update(values)
+    return rec
+
+
+# ---------------------------------------------------------
+# BENCHMARKS
+# ---------------------------------------------------------
+def bench_generate_obstacles(cfg, repeat):
+    seed = cfg["seeds"][0]
+    for n, cs in itertools.product(cfg["obstacles"], cfg["canvas"]):
+        kwargs = {"width": cs[0], "height": cs[1],
+                  "start": (50, 50), "end": (cs[0] - 50, cs[1] - 50)}
+        got = len(make_scenario(seed, n, cs)["obstacles"])
+
+        # Seeded once: the timed calls continue the same RNG stream
+        np.random.seed(seed)
+        fn = lambda: generate_obstacles(n, **kwargs)
+        yield _record("generate_obstacles",
+                      {"obstacles": n, "canvas": _canvas(cs)},
+                      placed=got, **time_call(fn, repeat))
+
+
+def bench_astar_path(cfg, repeat):
+    seed = cfg["seeds"][0]
+    for n, cs in itertools.product(cfg["obstacles"], cfg["canvas"]):
+        scn = make_scenario(seed, n, cs)
+        fn = lambda: astar_path(scn["start"], scn["end"], scn["obstacles"],
+                                cs, clearance=CLEARANCE)
+        path = fn()
+        quality = {"found": path is not None}
+        if path is not None:
+            quality["path_length"] = path_length(path)
+            quality["min_clearance"] = min_clearance(path, scn["obstacles"])
+        yield _record("astar_path", {"obstacles": n, "canvas": _canvas(cs)},
+                      **quality, **time_call(fn, repeat))
+
+
+def bench_build_spline(cfg, repeat):
+    seed = cfg["seeds"][0]
+    for cs, k, m in itertools.product(cfg["canvas"], cfg["n_ctrl"],
+                                      cfg["n_samples"]):
+        scn = make_scenario(seed, 0, cs)
+        ctrl = initial_ctrl(scn, k)
+        fn = lambda: build_spline(ctrl, scn["start"], scn["end"], m)
+        yield _record("build_spline",
+                      {"canvas": _canvas(cs), "n_ctrl": k, "n_samples": m},
+                      **time_call(fn, repeat))
+
+
+def bench_obstacle_penalty(cfg, repeat):
+    seed, k = cfg["seeds"][0], 12
+    for n, cs, m in itertools.product(cfg["obstacles"], cfg["canvas"],
+                                      cfg["n_samples"]):
+        scn = make_scenario(seed, n, cs)
+        samples = build_spline(initial_ctrl(scn, k), scn["start"],
+                               scn["end"], m)
+        fn = lambda: obstacle_penalty(samples, scn["obstacles"], CLEARANCE)
+        yield _record("obstacle_penalty",
+                      {"obstacles": n, "canvas": _canvas(cs), "n_samples": m},
+                      feasible=bool(np.isfinite(fn())),
+                      **time_call(fn, repeat))
+
+
+def bench_objective(cfg, repeat):
+    seed = cfg["seeds"][0]
+    for n, cs, k, m in itertools.product(cfg["obstacles"], cfg["canvas"],
+                                         cfg["n_ctrl"], cfg["n_samples"]):
+        scn = make_scenario(seed, n, cs)
+        flat = initial_ctrl(scn, k).ravel()
+        args = (scn["start"], scn["end"], scn["obstacles"], cs[0], cs[1],
+                k, CLEARANCE, LAM, GAMMA, None, m)
+        fn = lambda: objective(flat, *args)
+        yield _record("objective",
+                      {"obstacles": n, "canvas": _canvas(cs),
+                       "n_ctrl": k, "n_samples": m},
+                      feasible=bool(np.isfinite(fn())),
+                      **time_call(fn, repeat))
+
+
+def bench_lagrangian_optimizer(cfg, repeat, runs_per_seed=3):
+    """
+    Each seed is planned runs_per_seed times and keeps its fastest run;
+    time_s is the sum over seeds, since seeds differ widely in work.
+    Quality is aggregated over the seeds (runs are deterministic).
+    """
+    for n, cs, k, m in itertools.product(cfg["obstacles"], cfg["canvas"],
+                                         cfg["n_ctrl"], cfg["n_samples"]):
+        seed_s = {}
+        lengths, clears, fallbacks, nfevs, nits = [], [], [], [], []
+        for seed in cfg["seeds"]:
+            scn = make_scenario(seed, n, cs)
+            best = np.inf
+            for _ in range(runs_per_seed):
+                # Uninstrumented: the path production runs
+                t0 = time.perf_counter()
+                res = lagrangian_optimizer(scn["start"], scn["end"],
+                                           scn["obstacles"], canvas_size=cs,
+                                           n_ctrl=k, n_samples=m,
+                                           return_result=True)
+                best = min(best, time.perf_counter() - t0)
+            seed_s[str(seed)] = best
+            lengths.append(res.cost)
+            clr = min_clearance(res.samples, scn["obstacles"])
+            if clr is not None:
+                clears.append(clr)
+            fallbacks.append(res.fallback_ran)
+            nfevs.append(res.nfev)
+            nits.append(res.nit)
+
+        yield _record("lagrangian_optimizer",
+                      {"obstacles": n, "canvas": _canvas(cs),
+                       "n_ctrl": k, "n_samples": m},
+                      seeds=len(cfg["seeds"]),
+                      runs_per_seed=runs_per_seed,
+                      time_s=float(sum(seed_s.values())),
+                      seed_s=seed_s,
+                      path_length=float(np.mean(lengths)),
+                      min_clearance=min(clears) if clears else None,
+                      fallback_rate=float(np.mean(fallbacks)),
+                      nfev_median=float(np.median(nfevs)),
+                      nit_median=float(np.median(nits)))
+
+
+BENCHES = {
+    "generate_obstacles": bench_generate_obstacles,
+    "astar_path": bench_astar_path,
+    "build_spline": bench_build_spline,
+    "obstacle_penalty": bench_obstacle_penalty,
+    "objective": bench_objective,
+    "lagrangian_optimizer": bench_lagrangian_optimizer,
+}
+
+
+# ---------------------------------------------------------
+# BASELINE COMPARISON
+# ---------------------------------------------------------
+def _key(rec):
+    return rec["bench"], json.dumps(rec["params"], sort_keys=True)
+
+
+def compare(results, baseline, time_tol=None, quality_tol=0.05):
+    """
+    Annotates results with baseline_ratio and returns a list of
+    human-readable regression messages (empty when everything is in range).
+    Baseline records of a bench that ran but are absent from results also
+    count as regressions. time_tol=None uses the per-bench TIME_TOL.
+    """
+    base = {_key(r): r for r in baseline["results"]}
+    regressions = []
+
+    if not results:
+        return ["no benchmark results to compare"]
+
+    ran = {rec["bench"] for rec in results}
+    seen = {_key(rec) for rec in results}
+    for key, old in base.items():
+        if old["bench"] in ran and key not in seen:
+            regressions.append(f"{old['bench']} {old['params']}: "
+                               "missing from this run")
+
+    for rec in results:
+        old = base.get(_key(rec))
+        if old is None:
+            continue
+        label = f"{rec['bench']} {rec['params']}"
+
+        # A path that is no longer found / feasible outweighs any metric
+        for flag in ("found", "feasible"):
+            if old.get(flag) and not rec.get(flag, False):
+                regressions.append(f"{label}: {flag} true → false")
+
+        ratio = rec["time_s"] / old["time_s"]
+        rec["baseline_ratio"] = ratio
+        tol = TIME_TOL[rec["bench"]] if time_tol is None else time_tol
+        if ratio > 1 + tol:
+            regressions.append(f"{label}: {ratio:.2f}x slower")
+
+        if rec.get("path_length") is not None and old.get("path_length"):
+            if rec["path_length"] > old["path_length"] * (1 + quality_tol):
+                regressions.append(
+                    f"{label}: path length {old['path_length']:.1f}"
+                    f" → {rec['path_length']:.1f}")
+
+        if (rec.get("min_clearance") is not None
+                and old.get("min_clearance") is not None):
+            drop = old["min_clearance"] - rec["min_clearance"]
+            if drop > max(1.0, quality_tol * abs(old["min_clearance"])):
+                regressions.append(
+                    f"{label}: min clearance {old['min_clearance']:.1f}"
+                    f" → {rec['min_clearance']:.1f}")
+
+        if rec.get("fallback_rate", 0.0) > old.get("fallback_rate", 0.0):
+            regressions.append(
+                f"{label}: fallback rate {old['fallback_rate']:.2f}"
+                f" → {rec['fallback_rate']:.2f}")
+
+    return regressions
+
+
+# ---------------------------------------------------------
+# ENTRY POINT
+# ---------------------------------------------------------
+def _meta(preset):
+    import scipy
+    return {"preset": preset, "python": platform.python_version(),
+            "numpy": np.__version__, "scipy": scipy.__version__,
+            "machine": platform.machine(), "platform": platform.platform()}
+
+
+def _format(rec):
+    params = " ".join(f"{k}={v}" for k, v in rec["params"].items())
+    line = f"{rec['bench']:<21} {params:<52} {rec['time_s']*1e3:10.3f} ms"
+    if "path_length" in rec:
+        line += f"  len={rec['path_length']:.1f}"
+    if rec.get("min_clearance") is not None:
+        line += f"  clr={rec['min_clearance']:.1f}"
+    if "fallback_rate" in rec:
+        line += f"  fb={rec['fallback_rate']:.2f}"
+    if "baseline_ratio" in rec:
+        line += f"  x{rec['baseline_ratio']:.2f}"
+    return line
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    ap.add_argument("--bench", choices=list(BENCHES), action="append",
+                    help="run only this benchmark (may be repeated)")
+    ap.add_argument("--repeat", type=int, default=30,
+                    help="timing repeats for the micro-benchmarks")
+    ap.add_argument("--out", help="write results as JSON to this path")
+    ap.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE,
+                    help="compare against a stored baseline "
+                         "(default: benchmarks/baseline.json)")
+    ap.add_argument("--save-baseline", metavar="PATH",
+                    help="store these results as the new baseline")
+    ap.add_argument("--time-tol", type=float, default=None,
+                    help="allowed slowdown for every bench, as a fraction "
+                         "(default: per-bench TIME_TOL)")
+    ap.add_argument("--quality-tol", type=float, default=0.05,
+                    help="allowed path-quality drift (default 0.05)")
+    args = ap.parse_args()
+
+    cfg = PRESETS[args.preset]
+    results = []
+    for name in args.bench or list(BENCHES):
+        for rec in BENCHES[name](cfg, args.repeat):
+            results.append(rec)
+            print(_format(rec), flush=True)
+
+    doc = {"meta": _meta(args.preset), "results": results}
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f),
+                                  args.time_tol, args.quality_tol)
+        doc["regressions"] = regressions
+
+        print(f"\nvs baseline {args.baseline}:")
+        for rec in results:
+            print(_format(rec))
+
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f, indent=2)
+            print(f"✅ Saved → {path}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) vs {args.baseline}:")
+        for msg in regressions:
+            print("  -", msg)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Cold-start benchmark: time to first window and time to first plan.
+
+Every sample runs in a fresh interpreter so that nothing is cached in
+sys.modules. Run from the project root:
+
+    python -m benchmarks.startup [--repeat 5] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each child prints a single JSON line with its in-process phase timings.
+FIRST_WINDOW = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+root = main.build_window()
+root.update()
+t2 = time.perf_counter()
+root.destroy()
+print(json.dumps({"import_s": t1 - t0, "build_s": t2 - t1,
+                  "modules": len(sys.modules)}))
+"""
+
+FIRST_PLAN = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import numpy as np
+from core.optimizer import generate_obstacles, lagrangian_optimizer
+t1 = time.perf_counter()
+np.random.seed(0)
+obstacles = generate_obstacles(4)
+lagrangian_optimizer((50, 50), (550, 350), obstacles)
+t2 = time.perf_counter()
+print(json.dumps({"import_s": t1 - t0, "plan_s": t2 - t1,
+                  "modules": len(sys.modules)}))
+"""
+
+SCENARIOS = {"first_window": FIRST_WINDOW, "first_plan": FIRST_PLAN}
+
+
+class NoDisplay(Exception):
+    """ Tk could not open a window (headless machine); scenario is skipped. """
+
+
+def run_once(code):
+    """ Runs code in a fresh interpreter; returns (wall seconds, child stats). """
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        err = proc.stderr.strip()
+        last = err.splitlines()[-1] if err else "child failed"
+        if last.startswith("_tkinter.TclError") and "display" in last:
+            raise NoDisplay(last)
+        raise RuntimeError(f"child exited with {proc.returncode}:\n{err}")
+    stats = json.loads(proc.stdout.strip().splitlines()[-1])
+    return wall, stats
+
+
+def bench(name, repeat):
+    walls, children = [], []
+    for _ in range(repeat):
+        wall, stats = run_once(SCENARIOS[name])
+        walls.append(wall)
+        children.append(stats)
+
+    result = {"scenario": name, "repeat": repeat,
+              "wall_median_s": statistics.median(walls),
+              "wall_min_s": min(walls),
+              "modules": children[-1]["modules"]}
+    for key in children[0]:
+        if key.endswith("_s"):
+            result[key.replace("_s", "_median_s")] = statistics.median(
+                c[key] for c in children)
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                    help="run only this scenario (may be repeated)")
+    ap.add_argument("--json", action="store_true",
+                    help="print one JSON object per scenario")
+    args = ap.parse_args()
+
+    for name in args.scenario or list(SCENARIOS):
+        try:
+            res = bench(name, args.repeat)
+        except NoDisplay as ex:
+            # Only a missing display is a skip; other failures propagate
+            res = {"scenario": name, "skipped": str(ex)}
+
+        if args.json:
+            print(json.dumps(res))
+        elif "skipped" in res:
+            print(f"{name:<13} skipped: {res['skipped']}")
+        else:
+            phases = "  ".join(f"{k[:-len('_median_s')]}={v*1000:.0f}ms"
+                               for k, v in res.items()
+                               if k.endswith("_median_s") and k != "wall_median_s")
+            print(f"{name:<13} wall={res['wall_median_s']*1000:.0f}ms "
+                  f"(min {res['wall_min_s']*1000:.0f}ms)  {phases}  "
+                  f"modules={res['modules']}")
+
+
+if __name__ == "__main__":
+    main()
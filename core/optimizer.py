@@ -1,8 +1,10 @@
 import numpy as np
-import pandas as pd
-from scipy.optimize import minimize
-from scipy.interpolate import splprep, splev
 import math
+from dataclasses import dataclass, field
+from core.profiling import timed
+
+# SciPy is imported inside build_spline / lagrangian_optimizer: it is only
+# needed once a plan is requested, not when this module is first loaded.
 
 
 # ---------------------------------------------------------
@@ -53,7 +55,8 @@ def generate_obstacles(
 # ---------------------------------------------------------
 # SIMPLE A* GRID PLANNER (SAFE FALLBACK)
 # ---------------------------------------------------------
-def astar_path(start, end, obstacles, canvas_size, grid=10, clearance=20):
+def astar_path(start, end, obstacles, canvas_size, grid=10, clearance=20,
+               profiler=None):
     W, H = canvas_size
     Wc, Hc = W // grid, H // grid
 
@@ -90,9 +93,11 @@ def astar_path(start, end, obstacles, canvas_size, grid=10, clearance=20):
     g = {s: 0}
 
     nbrs = [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(1,1),(1,-1),(-1,1)]
+    expanded = 0
 
     while pq:
         _, cur = heapq.heappop(pq)
+        expanded += 1
         if cur == e:
             break
         r, c = cur
@@ -107,6 +112,9 @@ def astar_path(start, end, obstacles, canvas_size, grid=10, clearance=20):
                     h = np.linalg.norm(np.array([nr,nc]) - np.array(e))
                     heapq.heappush(pq, (new_g + h, (nr,nc)))
 
+    if profiler is not None:
+        profiler.count("astar_expansions", expanded)
+
     if e not in came:
         return None
 
@@ -125,6 +133,8 @@ def astar_path(start, end, obstacles, canvas_size, grid=10, clearance=20):
 # SAFE SPLINE BUILDER
 # ---------------------------------------------------------
 def build_spline(ctrl, start, end, n_samples=200):
+    from scipy.interpolate import splprep, splev
+
     try:
         pts = np.vstack([start, ctrl, end]).astype(float)
         k = min(3, len(pts)-1)
@@ -166,16 +176,23 @@ def obstacle_penalty(samples, obstacles, clearance=20):
 # OBJECTIVE
 # ---------------------------------------------------------
 def objective(flat, start, end, obstacles, width, height,
-              n_ctrl, clearance, lam, gamma):
+              n_ctrl, clearance, lam, gamma, profiler=None, n_samples=200):
 
     ctrl = flat.reshape(n_ctrl, 2)
-    samples = build_spline(ctrl, start, end)
+    with timed(profiler, "spline"):
+        samples = build_spline(ctrl, start, end, n_samples)
 
     # Path length
     length = np.sum(np.linalg.norm(np.diff(samples, axis=0), axis=1))
 
     # Obstacle penalty (hard)
-    pen_obs = obstacle_penalty(samples, obstacles, clearance)
+    with timed(profiler, "barrier"):
+        pen_obs = obstacle_penalty(samples, obstacles, clearance)
+
+    if profiler is not None:
+        profiler.count("objective_evals")
+        if pen_obs == np.inf:
+            profiler.count("barrier_infeasible")
 
     # Curvature smoothing
     reg = curvature(ctrl)
@@ -183,6 +200,33 @@ def objective(flat, start, end, obstacles, width, height,
     return length + lam*pen_obs + gamma*reg
 
 
+# ---------------------------------------------------------
+# STRUCTURED RESULT
+# ---------------------------------------------------------
+@dataclass
+class OptimizationResult:
+    """
+    Full outcome of one lagrangian_optimizer run (return_result=True).
+    timings is {phase: seconds} and is only filled in when a Profiler was
+    passed; it covers this run only, even when the profiler is reused.
+    """
+    samples: np.ndarray
+    cost: float
+    lambda_avg: float
+    success: bool           # L-BFGS-B convergence flag
+    status: int
+    message: str
+    nit: int
+    nfev: int
+    fallback_ran: bool = False      # optimized path was unsafe → A* tried
+    fallback_used: bool = False     # A* path replaced the optimized one
+    timings: dict = field(default_factory=dict)
+
+    def as_tuple(self):
+        """ (samples, final_cost, lambda_avg), as returned by default. """
+        return self.samples, self.cost, self.lambda_avg
+
+
 # ---------------------------------------------------------
 # MAIN OPTIMIZER — ALWAYS RETURNS SAFE PATH
 # ---------------------------------------------------------
@@ -192,8 +236,20 @@ def lagrangian_optimizer(
     n_ctrl=12,
     lam=25.0,
     gamma=2.5,
-    clearance=22.0
+    clearance=22.0,
+    profiler=None,
+    return_result=False,
+    n_samples=200
 ):
+    """
+    Returns (samples, final_cost, lambda_avg), or an OptimizationResult
+    when return_result=True.
+    profiler: optional core.profiling.Profiler — records per-phase wall
+              time, evaluation counters and streams per-iteration progress.
+    n_samples: points sampled along the spline (barrier + returned path)
+    """
+    from scipy.optimize import minimize
+
     width, height = canvas_size
     start = np.array(start, float)
     end   = np.array(end, float)
@@ -211,37 +267,79 @@ def lagrangian_optimizer(
         bounds.append((10, width-10))
         bounds.append((10, height-10))
 
+    # Per-iteration progress (only when profiling)
+    callback = None
+    if profiler is not None:
+        profiler.start_run()
+
+        def callback(intermediate_result):
+            # SciPy >= 1.11 passes an OptimizeResult; older versions pass xk
+            # Non-finite costs (barrier hit) become None → valid JSON
+            fun = getattr(intermediate_result, "fun", None)
+            profiler.iteration(
+                cost=float(fun) if fun is not None and np.isfinite(fun) else None,
+                nfev=profiler.run_count("objective_evals"))
+
     # ---------------------------------------------
     # Run Optimization
     # ---------------------------------------------
-    res = minimize(
-        objective,
-        init_ctrl.ravel(),
-        args=(start, end, obstacles, width, height, n_ctrl, clearance, lam, gamma),
-        method="L-BFGS-B",
-        bounds=bounds,
-        options={"maxiter": 250}
-    )
+    with timed(profiler, "minimize"):
+        res = minimize(
+            objective,
+            init_ctrl.ravel(),
+            args=(start, end, obstacles, width, height, n_ctrl, clearance,
+                  lam, gamma, profiler, n_samples),
+            method="L-BFGS-B",
+            bounds=bounds,
+            callback=callback,
+            options={"maxiter": 250}
+        )
 
     ctrl = res.x.reshape(n_ctrl, 2)
-    samples = build_spline(ctrl, start, end)
+    with timed(profiler, "spline"):
+        samples = build_spline(ctrl, start, end, n_samples)
 
     # ---------------------------------------------
     # Check feasibility — fallback to A* if unsafe
     # ---------------------------------------------
-    safe = True
-    for c, r in obstacles:
-        if np.min(np.linalg.norm(samples - c, axis=1)) <= (r + clearance):
-            safe = False
-            break
+    with timed(profiler, "feasibility"):
+        safe = True
+        for c, r in obstacles:
+            if np.min(np.linalg.norm(samples - c, axis=1)) <= (r + clearance):
+                safe = False
+                break
 
+    fallback_used = False
     if not safe:
-        fallback = astar_path(start, end, obstacles, canvas_size, grid=10, clearance=clearance)
+        with timed(profiler, "astar"):
+            fallback = astar_path(start, end, obstacles, canvas_size, grid=10,
+                                  clearance=clearance, profiler=profiler)
         if fallback is not None and len(fallback) > 1:
             samples = fallback
+            fallback_used = True
 
     # Final metrics
     final_cost = np.sum(np.linalg.norm(np.diff(samples, axis=0), axis=1))
     lambda_avg = lam
 
-    return samples, final_cost, lambda_avg
+    if profiler is not None:
+        profiler.count("runs")
+        profiler.count("fallback_runs", int(not safe))
+        profiler.count("fallback_used", int(fallback_used))
+
+    if not return_result:
+        return samples, final_cost, lambda_avg
+
+    return OptimizationResult(
+        samples=samples,
+        cost=float(final_cost),
+        lambda_avg=lambda_avg,
+        success=bool(res.success),
+        status=int(res.status),
+        message=str(res.message),
+        nit=int(res.nit),
+        nfev=int(res.nfev),
+        fallback_ran=not safe,
+        fallback_used=fallback_used,
+        timings=profiler.run_timings() if profiler is not None else {},
+    )
@@ -0,0 +1,108 @@
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+
+# ---------------------------------------------------------
+# OPT-IN PLANNER INSTRUMENTATION
+# ---------------------------------------------------------
+class Profiler:
+    """
+    Collects wall time per phase and named counters for one or more
+    planner runs. Pass an instance as `profiler=` to lagrangian_optimizer.
+
+    on_iteration: optional callable, receives one dict per optimizer
+                  iteration ({"iteration", "elapsed_s", "cost", "nfev"});
+                  cost is None when unknown or not finite (barrier hit).
+
+    Phases may nest (e.g. "spline" and "barrier" run inside "minimize"),
+    so phase totals are not meant to add up to the overall wall time.
+
+    phases / counters / records() accumulate over every run; start_run()
+    marks a run boundary, and iteration events, run_count() and
+    run_timings() are measured from the latest one.
+    """
+
+    def __init__(self, on_iteration=None):
+        self.on_iteration = on_iteration
+        self.phases = {}        # name -> [calls, total seconds]
+        self.counters = {}      # name -> int
+        self.start_run()
+
+    def start_run(self):
+        """ Snapshots the totals so per-run figures count from here. """
+        self._run_t0 = time.perf_counter()
+        self._run_phases = {name: tuple(rec) for name, rec in self.phases.items()}
+        self._run_counters = dict(self.counters)
+
+    @contextmanager
+    def phase(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            rec = self.phases.setdefault(name, [0, 0.0])
+            rec[0] += 1
+            rec[1] += time.perf_counter() - t
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def iteration(self, **info):
+        """ Records one optimizer iteration and streams it to on_iteration. """
+        self.count("iterations")
+        if self.on_iteration is not None:
+            event = {"iteration": self.run_count("iterations"),
+                     "elapsed_s": time.perf_counter() - self._run_t0}
+            event.update(info)
+            self.on_iteration(event)
+
+    def timings(self):
+        """ {phase: total seconds} over all runs """
+        return {name: total for name, (_, total) in self.phases.items()}
+
+    def run_count(self, name):
+        """ Counter value since the last start_run(). """
+        return self.counters.get(name, 0) - self._run_counters.get(name, 0)
+
+    def run_timings(self):
+        """ {phase: seconds} for phases entered since the last start_run(). """
+        out = {}
+        for name, (calls, total) in self.phases.items():
+            base_calls, base_total = self._run_phases.get(name, (0, 0.0))
+            if calls > base_calls:
+                out[name] = total - base_total
+        return out
+
+    # -----------------------------------------------------
+    # EXPORT
+    # -----------------------------------------------------
+    def records(self, **tags):
+        """
+        One dict per phase plus one "counters" dict. Extra keyword
+        arguments (e.g. scenario="dense") are copied into every record.
+        """
+        out = []
+        for name, (calls, total) in self.phases.items():
+            rec = dict(tags)
+            rec.update({"kind": "phase", "phase": name,
+                        "calls": calls, "total_s": total})
+            out.append(rec)
+        rec = dict(tags)
+        rec.update({"kind": "counters"}, **self.counters)
+        out.append(rec)
+        return out
+
+    def write_jsonl(self, fp, **tags):
+        """ Appends records() as JSON lines to a path or open text file. """
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, "a", encoding="utf-8") as f:
+                return self.write_jsonl(f, **tags)
+        for rec in self.records(**tags):
+            fp.write(json.dumps(rec) + "\n")
+
+
+def timed(profiler, name):
+    """ profiler.phase(name), or a no-op context when profiling is off. """
+    return profiler.phase(name) if profiler is not None else nullcontext()
@@ -1,10 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
-from core.optimizer import generate_obstacles, lagrangian_optimizer
 from gui.visualizer import draw_environment
-from ml.model_predict import predict_path_cost
-from ml.model_train import train_and_save_model
+
+# NOTE: core (NumPy/SciPy) and ml (scikit-learn/joblib) are imported inside
+# the callbacks that need them, so the first window appears without paying
+# for those imports.
 
 
 # ============================================================
@@ -76,27 +76,6 @@ def animate_drone(canvas, path, speed=3):
     return
 
 
-# ============================================================
-#                      GUI SETUP
-# ============================================================
-root = tk.Tk()
-root.title("Drone Path Optimization – Lagrangian Method")
-root.geometry("950x600")
-root.config(bg="#1e1e1e")
-apply_modern_style(root)
-
-# Layout Frames
-left_panel = tk.Frame(root, bg="#1e1e1e", width=250)
-left_panel.pack(side="left", fill="y")
-
-canvas_frame = tk.Frame(root, bg="#1e1e1e")
-canvas_frame.pack(side="right", expand=True)
-
-canvas = tk.Canvas(canvas_frame, width=650, height=500,
-                   bg="#161616", highlightthickness=0)
-canvas.pack(padx=20, pady=20)
-
-
 # ============================================================
 #             INPUT FORM ELEMENTS
 # ============================================================
@@ -110,36 +89,15 @@ def labeled_entry(parent, text, default):
     return ent
 
 
-tk.Label(left_panel, text="✈ Drone Optimizer", font=("Segoe UI", 16, "bold"),
-         bg="#1e1e1e", fg="white").pack(pady=15)
-
-start_x = labeled_entry(left_panel, "Start X:", "50")
-start_y = labeled_entry(left_panel, "Start Y:", "50")
-end_x = labeled_entry(left_panel, "End X:", "550")
-end_y = labeled_entry(left_panel, "End Y:", "350")
-num_obs = labeled_entry(left_panel, "Number of Obstacles:", "4")
-
-
-# STATUS PANEL
-status_label = tk.Label(left_panel, text="Status: Idle",
-                        bg="#1e1e1e", fg="#00FFAA",
-                        font=("Segoe UI", 11, "italic"))
-status_label.pack(pady=15)
-
-
 def set_status(text):
     status_label.config(text=f"Status: {text}")
     status_label.update()
 
 
-# COST INFO
-cost_lbl = tk.Label(left_panel, text="Cost: -", bg="#1e1e1e", fg="white",
-                    font=("Segoe UI", 12))
-cost_lbl.pack()
-
-lambda_lbl = tk.Label(left_panel, text="λ_avg: -", bg="#1e1e1e", fg="white",
-                      font=("Segoe UI", 12))
-lambda_lbl.pack(pady=5)
+def modern_button(text, cmd):
+    b = ttk.Button(left_panel, text=text, command=cmd)
+    b.pack(fill="x", pady=5)
+    return b
 
 
 # ============================================================
@@ -155,6 +113,7 @@ def run_optimization():
         return
 
     set_status("Generating obstacles...")
+    from core.optimizer import generate_obstacles, lagrangian_optimizer
     obstacles = generate_obstacles(n, start=s, end=e)
 
     # Draw obstacles
@@ -194,6 +153,7 @@ def predict_path():
     lam_val = float(lam_text) if lam_text != "-" else 25.0
 
     try:
+        from ml.model_predict import predict_path_cost
         pred = predict_path_cost(s, e, n, lam_val)
         messagebox.showinfo("Predicted Path Cost", f"Predicted Cost ≈ {pred:.2f}")
         set_status("Prediction completed.")
@@ -204,26 +164,100 @@ def predict_path():
 def train_ml_now():
     try:
         set_status("Training ML model...")
-        train_and_save_model()
+        from ml.model_train import train_and_save_model
+        # Evaluation plots render in a background process → results/
+        _, _, report_proc = train_and_save_model(report=True, background=True)
         messagebox.showinfo("ML Training", "Model trained successfully!")
-        set_status("ML Model Updated.")
+        if report_proc is None:
+            # The running report's watcher starts this one when it is done
+            set_status("ML Model Updated. Report queued...")
+        else:
+            set_status("ML Model Updated. Rendering report...")
+            watch_report(report_proc)
     except Exception as ex:
         messagebox.showerror("ML Training Error", str(ex))
 
 
-# ============================================================
-#                     BUTTONS
-# ============================================================
-def modern_button(text, cmd):
-    b = ttk.Button(left_panel, text=text, command=cmd)
-    b.pack(fill="x", pady=5)
-    return b
+def watch_report(proc):
+    """ Polls the background report process and surfaces failures. """
+    if proc.is_alive():
+        status_label.after(500, watch_report, proc)
+        return
+    proc.join()
 
+    from ml.model_report import report_error, start_pending_report
+    err = report_error(proc)
+    if err:
+        messagebox.showerror("ML Report Error", err)
 
-modern_button("Run Optimization", run_optimization)
-modern_button("Predict Cost (ML)", predict_path)
-modern_button("Train / Update ML", train_ml_now)
+    queued = start_pending_report()
+    if queued is not None:
+        set_status("ML Model Updated. Rendering queued report...")
+        watch_report(queued)
+    elif err:
+        set_status("ML Model Updated (report failed).")
+    else:
+        set_status("ML Model Updated. Report saved in results/.")
 
 
 # ============================================================
-root.mainloop()
+#                      GUI SETUP
+# ============================================================
+def build_window():
+    """ Builds the main window and its widgets; returns the Tk root. """
+    global canvas, start_x, start_y, end_x, end_y, num_obs
+    global left_panel, status_label, cost_lbl, lambda_lbl
+
+    root = tk.Tk()
+    root.title("Drone Path Optimization – Lagrangian Method")
+    root.geometry("950x600")
+    root.config(bg="#1e1e1e")
+    apply_modern_style(root)
+
+    # Layout Frames
+    left_panel = tk.Frame(root, bg="#1e1e1e", width=250)
+    left_panel.pack(side="left", fill="y")
+
+    canvas_frame = tk.Frame(root, bg="#1e1e1e")
+    canvas_frame.pack(side="right", expand=True)
+
+    canvas = tk.Canvas(canvas_frame, width=650, height=500,
+                       bg="#161616", highlightthickness=0)
+    canvas.pack(padx=20, pady=20)
+
+    tk.Label(left_panel, text="✈ Drone Optimizer", font=("Segoe UI", 16, "bold"),
+             bg="#1e1e1e", fg="white").pack(pady=15)
+
+    start_x = labeled_entry(left_panel, "Start X:", "50")
+    start_y = labeled_entry(left_panel, "Start Y:", "50")
+    end_x = labeled_entry(left_panel, "End X:", "550")
+    end_y = labeled_entry(left_panel, "End Y:", "350")
+    num_obs = labeled_entry(left_panel, "Number of Obstacles:", "4")
+
+    # STATUS PANEL
+    status_label = tk.Label(left_panel, text="Status: Idle",
+                            bg="#1e1e1e", fg="#00FFAA",
+                            font=("Segoe UI", 11, "italic"))
+    status_label.pack(pady=15)
+
+    # COST INFO
+    cost_lbl = tk.Label(left_panel, text="Cost: -", bg="#1e1e1e", fg="white",
+                        font=("Segoe UI", 12))
+    cost_lbl.pack()
+
+    lambda_lbl = tk.Label(left_panel, text="λ_avg: -", bg="#1e1e1e", fg="white",
+                          font=("Segoe UI", 12))
+    lambda_lbl.pack(pady=5)
+
+    # BUTTONS
+    modern_button("Run Optimization", run_optimization)
+    modern_button("Predict Cost (ML)", predict_path)
+    modern_button("Train / Update ML", train_ml_now)
+
+    return root
+
+
+# Guarded so that worker processes (e.g. the background ML report)
+# re-importing this module do not open a second window.
+if __name__ == "__main__":
+    build_window().mainloop()
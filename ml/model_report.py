@@ -0,0 +1,165 @@
+import os
+import numpy as np
+
+
+# ============================================================
+#              ML EVALUATION GRAPHS (REPORTING)
+# ============================================================
+def _pyplot():
+    """
+    Imports matplotlib on first use only. The Agg backend renders straight
+    to files, so the report also works from a background process.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_pred_vs_actual(y_true, y_pred, save_path, r2):
+    plt = _pyplot()
+
+    plt.figure(figsize=(8,6))
+    plt.scatter(y_true, y_pred, alpha=0.6)
+
+    # Diagonal reference line
+    min_v = min(min(y_true), min(y_pred))
+    max_v = max(max(y_true), max(y_pred))
+    plt.plot([min_v, max_v], [min_v, max_v], "r--", label="Ideal Fit")
+
+    plt.title(f"Predicted vs Actual Costs (R² = {r2:.3f})", fontsize=14)
+    plt.xlabel("Actual Cost")
+    plt.ylabel("Predicted Cost")
+    plt.grid(True)
+    plt.legend()
+
+    plt.savefig(save_path, dpi=150)
+    plt.close()
+    print("✅ Saved:", save_path)
+
+
+def plot_residuals(y_true, y_pred, save_path):
+    plt = _pyplot()
+    residuals = y_true - y_pred
+
+    plt.figure(figsize=(8,6))
+    plt.scatter(y_pred, residuals, alpha=0.6)
+    plt.axhline(0, color='red', linestyle='--')
+
+    plt.title("Residual Plot (Error vs Predicted)", fontsize=14)
+    plt.xlabel("Predicted Cost")
+    plt.ylabel("Residual (Actual - Predicted)")
+    plt.grid(True)
+
+    plt.savefig(save_path, dpi=150)
+    plt.close()
+    print("✅ Saved:", save_path)
+
+
+def plot_error_histogram(y_true, y_pred, save_path):
+    plt = _pyplot()
+    errors = y_true - y_pred
+
+    plt.figure(figsize=(8,6))
+    plt.hist(errors, bins=30, edgecolor="black", alpha=0.7)
+
+    plt.title("Prediction Error Distribution", fontsize=14)
+    plt.xlabel("Error")
+    plt.ylabel("Frequency")
+    plt.grid(True)
+
+    plt.savefig(save_path, dpi=150)
+    plt.close()
+    print("✅ Saved:", save_path)
+
+
+# ============================================================
+#                   FULL EVALUATION REPORT
+# ============================================================
+def save_evaluation_report(y_true, y_pred, r2, out_dir="results"):
+    """
+    Renders all evaluation plots for one trained model into out_dir.
+    y_true, y_pred: array-likes of equal length (test targets / predictions)
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    # ✅ A) Predicted vs Actual
+    plot_pred_vs_actual(y_true, y_pred,
+                        os.path.join(out_dir, "predicted_vs_actual.png"),
+                        r2)
+
+    # ✅ B) Residual Plot
+    plot_residuals(y_true, y_pred,
+                   os.path.join(out_dir, "residual_plot.png"))
+
+    # ✅ C) Error Histogram
+    plot_error_histogram(y_true, y_pred,
+                         os.path.join(out_dir, "error_histogram.png"))
+
+    print(f"\n✅ ALL evaluation plots saved in /{out_dir} folder")
+
+
+# Last background report, and the arguments of a report queued behind it:
+# two processes never write the same PNGs at once, and nobody blocks.
+_report_proc = None
+_pending_report = None
+
+
+def _launch_report(args):
+    import multiprocessing
+    global _report_proc
+
+    proc = multiprocessing.Process(target=save_evaluation_report, args=args)
+    proc.start()
+    _report_proc = proc
+    return proc
+
+
+def start_report_process(y_true, y_pred, r2, out_dir="results"):
+    """
+    Renders the evaluation report in a separate process so the caller
+    (e.g. the GUI) does not wait on matplotlib. Returns the started Process;
+    check it with report_error() once it has finished.
+
+    If the previous report is still rendering, this one is queued instead
+    (a newer request replaces an older queued one) and None is returned;
+    start_pending_report() launches it once the previous one is done.
+    """
+    global _pending_report
+
+    args = (np.asarray(y_true, dtype=float),
+            np.asarray(y_pred, dtype=float),
+            float(r2), out_dir)
+
+    if _report_proc is not None and _report_proc.is_alive():
+        _pending_report = args
+        return None
+    return _launch_report(args)
+
+
+def start_pending_report():
+    """
+    Starts the queued report if the previous one has finished.
+    Returns its Process, or None if nothing was started.
+    """
+    global _pending_report
+
+    if _pending_report is None:
+        return None
+    if _report_proc is not None and _report_proc.is_alive():
+        return None
+    args, _pending_report = _pending_report, None
+    return _launch_report(args)
+
+
+def report_error(proc):
+    """
+    None while the report process is running or after it succeeded,
+    otherwise an error message (the traceback goes to the console).
+    """
+    if proc.is_alive() or proc.exitcode == 0:
+        return None
+    return f"Evaluation report failed (exit code {proc.exitcode})."